@@ -1,11 +1,36 @@
+from typing import Any
+
 from django.contrib import admin
+from django.db.models import ManyToManyField, QuerySet
+from django.forms import ModelMultipleChoiceField
+from django.http import HttpRequest
 
-from .models import Edible
+from .models import Edible, EdibleQuerySet
 
 
 class EdibleAdmin(admin.ModelAdmin):
-    filter_horizontal = ("ingredients",)
-    list_display = ("id", "name")
+    autocomplete_fields = ("ingredients",)
+    search_fields = ("name",)
+    # The autocomplete endpoint paginates get_queryset(), which needs an order
+    ordering = ("name",)
+    list_display = ("id", "name", "ingredient_count")
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Edible]:
+        # Annotate the count used by ingredient_count and Edible.__str__
+        queryset = super().get_queryset(request)
+        assert isinstance(queryset, EdibleQuerySet)
+        return queryset.with_ingredient_count()
+
+    def formfield_for_manytomany(
+        self, db_field: ManyToManyField, request: HttpRequest | None, **kwargs: Any
+    ) -> ModelMultipleChoiceField:
+        if db_field.name == "ingredients":
+            kwargs["queryset"] = Edible.objects.with_ingredient_count()
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+    @admin.display(ordering="num_ingredients", description="Ingredients")
+    def ingredient_count(self, obj: Edible) -> int:
+        return obj.num_ingredients  # type: ignore[attr-defined, no-any-return]
 
 
 # Register your models here.
@@ -1,35 +1,33 @@
-from typing import Any
-
 from django import forms
 
 from .models import Edible
 
+NAME_HELP_TEXT = "Give your edible a short, unique name (max 64 chars)."
+INGREDIENTS_HELP_TEXT = "Optionally select one or more existing edibles as ingredients."
+
+# Show the help text as a Bootstrap tooltip on the widget
+TOOLTIP_ATTRS = {"data-bs-toggle": "tooltip", "data-bs-placement": "top"}
+
 
 class EdibleQuickForm(forms.ModelForm):
     """Create an Edible with a name and optional ingredients."""
 
     ingredients = forms.ModelMultipleChoiceField(
-        queryset=Edible.objects.all(),
+        # Option labels show the ingredient count of each edible
+        queryset=Edible.objects.with_ingredient_count().only("id", "name"),
         required=False,
         widget=forms.SelectMultiple(
             attrs={
                 "class": "form-select",
                 "data-placeholder": "Type to search ingredients",
                 "placeholder": "Type to search ingredients",
+                "title": INGREDIENTS_HELP_TEXT,
+                **TOOLTIP_ATTRS,
             }
         ),
-        help_text="Optionally select one or more existing edibles as ingredients.",
+        help_text=INGREDIENTS_HELP_TEXT,
     )
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        # Move help text into tooltip attributes on the widgets
-        for name, field in self.fields.items():
-            if field.help_text:
-                field.widget.attrs.setdefault("title", field.help_text)
-                field.widget.attrs.setdefault("data-bs-toggle", "tooltip")
-                field.widget.attrs.setdefault("data-bs-placement", "top")
-
     class Meta:
         model = Edible
         fields = ["name", "ingredients"]
@@ -40,9 +38,22 @@ class EdibleQuickForm(forms.ModelForm):
                     "placeholder": "e.g. Avocado Toast",
                     "maxlength": 64,
                     "autofocus": True,
+                    "title": NAME_HELP_TEXT,
+                    **TOOLTIP_ATTRS,
                 }
             )
         }
         help_texts = {
-            "name": "Give your edible a short, unique name (max 64 chars).",
+            "name": NAME_HELP_TEXT,
         }
+
+    def clean_name(self) -> str:
+        name: str = self.cleaned_data["name"]
+        # Names are unique regardless of case. The database constraint would
+        # only report this as a non-field error, which the index page hides.
+        duplicates = Edible.objects.filter(name__iexact=name).exclude(
+            pk=self.instance.pk
+        )
+        if duplicates.exists():
+            raise forms.ValidationError("An edible with this name already exists.")
+        return name
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:39
+
+from typing import Any
+
+from django.apps.registry import Apps
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.models.functions import Lower
+
+
+def merge_case_insensitive_duplicates(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    """
+    Merge edibles whose names only differ in case into the oldest of them, so the
+    case-insensitive unique constraint can be added. Links of the merged edibles
+    are moved to the kept one.
+    """
+    Edible: Any = apps.get_model("edibles", "Edible")
+    Meal: Any = apps.get_model("meals", "Meal")
+
+    kept: dict[str, Any] = {}
+    edibles = Edible.objects.annotate(name_lower=Lower("name")).order_by("pk")
+    for edible in edibles:
+        keeper = kept.setdefault(edible.name_lower, edible)
+        if keeper.pk == edible.pk:
+            continue
+
+        keeper.ingredients.add(
+            *edible.ingredients.exclude(pk__in=[keeper.pk, edible.pk])
+        )
+        for parent in edible.used_in.exclude(pk__in=[keeper.pk, edible.pk]):
+            parent.ingredients.add(keeper)
+        for meal in Meal.objects.filter(edibles=edible):
+            meal.edibles.add(keeper)
+        edible.delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("edibles", "0004_alter_edible_ingredients"),
+        ("meals", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_case_insensitive_duplicates, migrations.RunPython.noop
+        ),
+    ]
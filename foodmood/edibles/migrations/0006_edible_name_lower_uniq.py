@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("edibles", "0005_merge_case_insensitive_edible_names"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="edible",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                name="edibles_edible_name_lower_uniq",
+                violation_error_message="An edible with this name already exists.",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("edibles", "0006_edible_name_lower_uniq"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="edible",
+            index=models.Index(
+                fields=["-creation_date"], name="edibles_edi_creatio_29fbca_idx"
+            ),
+        ),
+    ]
@@ -1,6 +1,22 @@
 # Create your models here.
 
 from django.db import models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+class EdibleQuerySet(models.QuerySet["Edible"]):
+    def with_ingredient_count(self) -> "EdibleQuerySet":
+        """Annotate num_ingredients, which Edible.__str__ uses instead of a query."""
+        return self.annotate(num_ingredients=Count("ingredients"))
+
+
+class EdibleManager(models.Manager["Edible"]):
+    def get_queryset(self) -> EdibleQuerySet:
+        return EdibleQuerySet(self.model, using=self._db)
+
+    def with_ingredient_count(self) -> EdibleQuerySet:
+        return self.get_queryset().with_ingredient_count()
 
 
 class Edible(models.Model):
@@ -17,8 +33,27 @@ class Edible(models.Model):
 
     used_in: models.QuerySet["Edible"]
 
+    objects = EdibleManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-creation_date"]),
+        ]
+        constraints = [
+            # Names are unique regardless of case, see quick_create_edible
+            models.UniqueConstraint(
+                Lower("name"),
+                name="edibles_edible_name_lower_uniq",
+                violation_error_message="An edible with this name already exists.",
+            ),
+        ]
+
     def __str__(self) -> str:
         ingredients = ""
-        if (num_ingredients := self.ingredients.count()) > 0:
+        # Use the count annotated by with_ingredient_count() to avoid a query
+        num_ingredients: int | None = getattr(self, "num_ingredients", None)
+        if num_ingredients is None:
+            num_ingredients = self.ingredients.count()
+        if num_ingredients > 0:
             ingredients = f" ({num_ingredients} ingredients)"
         return f"{self.name}{ingredients}"
@@ -1,19 +1,27 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
 
 from .models import Edible
 
 
 class IngredientsTestCase(TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         # Create edibles
-        oil = Edible.objects.create(name="Oil")
-        vinegar = Edible.objects.create(name="Vinegar")
-        salt = Edible.objects.create(name="Salt")
-        pepper = Edible.objects.create(name="Pepper")
-        dressing = Edible.objects.create(name="Dressing")
-        cucumber = Edible.objects.create(name="Cucumber")
-        lettuce = Edible.objects.create(name="Lettuce")
-        salad = Edible.objects.create(name="Mixed Salad")
+        oil, vinegar, salt, pepper, dressing, cucumber, lettuce, salad = (
+            Edible.objects.bulk_create(
+                [
+                    Edible(name="Oil"),
+                    Edible(name="Vinegar"),
+                    Edible(name="Salt"),
+                    Edible(name="Pepper"),
+                    Edible(name="Dressing"),
+                    Edible(name="Cucumber"),
+                    Edible(name="Lettuce"),
+                    Edible(name="Mixed Salad"),
+                ]
+            )
+        )
 
         # Set ingredients
         dressing.ingredients.set([oil, vinegar, salt, pepper])
@@ -33,3 +41,82 @@ class IngredientsTestCase(TestCase):
     def test_ingredients_count_of_ingredient(self) -> None:
         salad = Edible.objects.get(name="Mixed Salad")
         self.assertEqual(salad.ingredients.get(name="Dressing").ingredients.count(), 4)
+
+
+class EdibleViewTestCase(TestCase):
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        oil, vinegar, dressing, salad = Edible.objects.bulk_create(
+            [Edible(name=name) for name in ("Oil", "Vinegar", "Dressing", "Salad")]
+        )
+        dressing.ingredients.set([oil, vinegar])
+        salad.ingredients.set([dressing])
+
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpassword123"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_login(self.user)
+
+    def test_index_view_query_count(self) -> None:
+        """Test that rendering the index does not query once per edible."""
+        # session, user, latest edibles, ingredient choices
+        with self.assertNumQueries(4):
+            response = self.client.get("/edibles/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Dressing (2 ingredients)")
+
+    def test_index_view_rejects_name_differing_only_in_case(self) -> None:
+        """Test that the index form shows an error for a case-variant name."""
+        response = self.client.post("/edibles/", {"name": "OIL"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "An edible with this name already exists.")
+        self.assertEqual(Edible.objects.filter(name__iexact="oil").count(), 1)
+
+    def test_admin_autocomplete_orders_edibles_by_name(self) -> None:
+        """Test that the admin autocomplete pages through edibles in name order."""
+        admin = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="testpassword123"
+        )
+        self.client.force_login(admin)
+        response = self.client.get(
+            "/admin/autocomplete/",
+            {"app_label": "meals", "model_name": "meal", "field_name": "edibles"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["text"] for result in response.json()["results"]],
+            [
+                "Dressing (2 ingredients)",
+                "Oil",
+                "Salad (1 ingredients)",
+                "Vinegar",
+            ],
+        )
+
+    def test_quick_create_returns_existing_edible_ignoring_case(self) -> None:
+        """Test that quick create does not create case-insensitive duplicates."""
+        response = self.client.post("/edibles/api/quick-create/", {"name": "oil"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["name"], "Oil")
+        self.assertTrue(response.json()["existing"])
+        self.assertEqual(Edible.objects.filter(name__iexact="oil").count(), 1)
+
+    def test_quick_create_creates_new_edible(self) -> None:
+        """Test that quick create creates an edible for an unknown name."""
+        response = self.client.post("/edibles/api/quick-create/", {"name": "Tomato"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["existing"])
+        self.assertTrue(Edible.objects.filter(name="Tomato").exists())
+
+    def test_detail_view_query_count(self) -> None:
+        """Test that the detail view uses the annotated ingredient count."""
+        dressing = Edible.objects.get(name="Dressing")
+        # session, user, edible, ingredients
+        with self.assertNumQueries(4):
+            response = self.client.get(f"/edibles/{dressing.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "2 ingredients")
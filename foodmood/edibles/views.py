@@ -1,5 +1,5 @@
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count
+from django.db import IntegrityError, transaction
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
 from django.views.decorators.http import require_http_methods
@@ -15,14 +15,18 @@ def index(request: HttpRequest) -> HttpResponse:
     if request.method == "POST":
         form = EdibleQuickForm(request.POST)
         if form.is_valid():
-            form.save()
+            # Commit the row and its many-to-many links together
+            with transaction.atomic():
+                form.save()
             return redirect("edibles:index")
     else:
         form = EdibleQuickForm()
 
-    latest_edibles = Edible.objects.annotate(
-        num_ingedients=Count("ingredients")
-    ).order_by("-creation_date")[:10]
+    latest_edibles = (
+        Edible.objects.with_ingredient_count()
+        .only("id", "name", "creation_date")
+        .order_by("-creation_date")[:10]
+    )
 
     return render(
         request,
@@ -38,29 +42,37 @@ def quick_create_edible(request: HttpRequest) -> JsonResponse:
     if not name:
         return JsonResponse({"ok": False, "error": "Name is required"}, status=400)
 
-    # Do not allow duplicates
-    existing = Edible.objects.filter(name__iexact=name).first()
-    if existing is not None:
+    # Do not allow duplicates, names are unique regardless of case. Creating
+    # first saves the lookup on the common path of a new name.
+    try:
+        with transaction.atomic():
+            edible = Edible.objects.create(name=name)
+    except IntegrityError:
+        existing = Edible.objects.filter(name__iexact=name).values("pk", "name").first()
+        if existing is None:
+            raise
         return JsonResponse(
-            {"ok": True, "id": existing.pk, "name": existing.name, "existing": True}
+            {
+                "ok": True,
+                "id": existing["pk"],
+                "name": existing["name"],
+                "existing": True,
+            }
         )
 
-    edible = Edible.objects.create(name=name)
-    return JsonResponse({"ok": True, "id": edible.pk, "name": edible.name})
+    return JsonResponse(
+        {"ok": True, "id": edible.pk, "name": edible.name, "existing": False}
+    )
 
 
 @login_required
 @require_http_methods(["GET"])
 def detail(request: HttpRequest, edible_id: int) -> HttpResponse:
-    edible = (
-        Edible.objects.filter(pk=edible_id)
-        .annotate(num_ingredients=Count("ingredients"))
-        .first()
-    )
+    edible = Edible.objects.with_ingredient_count().filter(pk=edible_id).first()
     if edible is None:
         return render(request, "edibles/edible_not_found.html", status=404)
 
-    ingredients = edible.ingredients.annotate(num_edibles=Count("ingredients"))
+    ingredients = Edible.objects.with_ingredient_count().filter(used_in=edible)
     return render(
         request,
         "edibles/detail.html",
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -124,6 +125,11 @@ AUTH_PASSWORD_VALIDATORS: list[dict[str, str]] = [
     },
 ]
 
+# Hash passwords with a fast hasher in tests, PBKDF2 would dominate their runtime
+TESTING: bool = sys.argv[1:2] == ["test"]
+if TESTING:
+    PASSWORD_HASHERS: list[str] = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
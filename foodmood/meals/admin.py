@@ -1,4 +1,10 @@
+from typing import Any
+
 from django.contrib import admin
+from django.db.models import ManyToManyField
+from django.forms import ModelMultipleChoiceField
+from django.http import HttpRequest
+from edibles.models import Edible
 
 from .models import Meal
 
@@ -7,7 +13,14 @@ class MealAdmin(admin.ModelAdmin):
     list_display = ("title", "category", "eaten_at", "creation_date")
     list_filter = ("category", "eaten_at")
     search_fields = ("title",)
-    filter_horizontal = ("edibles",)
+    autocomplete_fields = ("edibles",)
+
+    def formfield_for_manytomany(
+        self, db_field: ManyToManyField, request: HttpRequest | None, **kwargs: Any
+    ) -> ModelMultipleChoiceField:
+        if db_field.name == "edibles":
+            kwargs["queryset"] = Edible.objects.with_ingredient_count()
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
 
 
 admin.site.register(Meal, MealAdmin)
@@ -6,35 +6,39 @@ from edibles.models import Edible
 
 from .models import Meal
 
+TITLE_HELP_TEXT = "Give your meal a descriptive title (max 128 chars)."
+CATEGORY_HELP_TEXT = "Select the meal category (Breakfast, Lunch, Dinner, or Snack)."
+EATEN_AT_HELP_TEXT = "When did you eat this meal?"
+EDIBLES_HELP_TEXT = "Optionally select one or more edibles for this meal."
+
+# Show the help text as a Bootstrap tooltip on the widget
+TOOLTIP_ATTRS = {"data-bs-toggle": "tooltip", "data-bs-placement": "top"}
+
 
 class MealForm(forms.ModelForm):
     """Create a Meal with title, category, eaten_at datetime, and optional edibles."""
 
     edibles = forms.ModelMultipleChoiceField(
-        queryset=Edible.objects.all(),
+        # Option labels show the ingredient count of each edible
+        queryset=Edible.objects.with_ingredient_count().only("id", "name"),
         required=False,
         widget=forms.SelectMultiple(
             attrs={
                 "class": "form-select",
                 "data-placeholder": "Type to search edibles",
                 "placeholder": "Type to search edibles",
+                "title": EDIBLES_HELP_TEXT,
+                **TOOLTIP_ATTRS,
             }
         ),
-        help_text="Optionally select one or more edibles for this meal.",
+        help_text=EDIBLES_HELP_TEXT,
     )
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        # Move help text into tooltip attributes on the widgets
-        for name, field in self.fields.items():
-            if field.help_text:
-                field.widget.attrs.setdefault("title", field.help_text)
-                field.widget.attrs.setdefault("data-bs-toggle", "tooltip")
-                field.widget.attrs.setdefault("data-bs-placement", "top")
-
         # Pre-fill eaten_at with current datetime if creating a new meal
         if not self.instance.pk and "eaten_at" in self.fields:
-            self.initial["eaten_at"] = timezone.now().strftime("%Y-%m-%dT%H:%M")
+            self.initial["eaten_at"] = timezone.now()
 
     class Meta:
         model = Meal
@@ -46,23 +50,29 @@ class MealForm(forms.ModelForm):
                     "placeholder": "e.g. Breakfast with Toast",
                     "maxlength": 128,
                     "autofocus": True,
+                    "title": TITLE_HELP_TEXT,
+                    **TOOLTIP_ATTRS,
                 }
             ),
             "category": forms.Select(
                 attrs={
                     "class": "form-select",
+                    "title": CATEGORY_HELP_TEXT,
+                    **TOOLTIP_ATTRS,
                 }
             ),
             "eaten_at": forms.DateTimeInput(
                 attrs={
                     "class": "form-control",
                     "type": "datetime-local",
+                    "title": EATEN_AT_HELP_TEXT,
+                    **TOOLTIP_ATTRS,
                 },
                 format="%Y-%m-%dT%H:%M",
             ),
         }
         help_texts = {
-            "title": "Give your meal a descriptive title (max 128 chars).",
-            "category": "Select the meal category (Breakfast, Lunch, Dinner, or Snack).",
-            "eaten_at": "When did you eat this meal?",
+            "title": TITLE_HELP_TEXT,
+            "category": CATEGORY_HELP_TEXT,
+            "eaten_at": EATEN_AT_HELP_TEXT,
         }
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("edibles", "0007_edible_creation_date_index"),
+        ("meals", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="meal",
+            options={"ordering": ["-eaten_at"]},
+        ),
+        migrations.AddIndex(
+            model_name="meal",
+            index=models.Index(
+                fields=["-eaten_at"], name="meals_meal_eaten_a_29bb0f_idx"
+            ),
+        ),
+    ]
@@ -1,7 +1,35 @@
 from django.db import models
+from django.db.models import Count, Prefetch
 from edibles.models import Edible
 
 
+class MealQuerySet(models.QuerySet["Meal"]):
+    def with_related(self) -> "MealQuerySet":
+        """Return meals with the edibles shown alongside them prefetched."""
+        return self.prefetch_related(
+            Prefetch("edibles", queryset=Edible.objects.only("id", "name"))
+        )
+
+    def recent_with_edible_counts(self, n: int = 10) -> "MealQuerySet":
+        """Return the n most recently eaten meals annotated with num_edibles."""
+        return (
+            self.only("id", "title", "category", "eaten_at")
+            .annotate(num_edibles=Count("edibles"))
+            .order_by("-eaten_at")[:n]
+        )
+
+
+class MealManager(models.Manager["Meal"]):
+    def get_queryset(self) -> MealQuerySet:
+        return MealQuerySet(self.model, using=self._db)
+
+    def with_related(self) -> MealQuerySet:
+        return self.get_queryset().with_related()
+
+    def recent_with_edible_counts(self, n: int = 10) -> MealQuerySet:
+        return self.get_queryset().recent_with_edible_counts(n)
+
+
 class Meal(models.Model):
     """
     A meal eaten by the user at a specific time, consisting of one or more edibles.
@@ -27,6 +55,12 @@ class Meal(models.Model):
     creation_date: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     update_date: models.DateTimeField = models.DateTimeField(auto_now=True)
 
+    objects = MealManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["-eaten_at"])]
+        ordering = ["-eaten_at"]
+
     def __str__(self) -> str:
         """Return a string representation of the meal."""
         formatted_date = self.eaten_at.strftime("%d.%m.%Y %H:%M")
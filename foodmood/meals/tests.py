@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 from edibles.models import Edible
 
@@ -10,11 +11,16 @@ from .models import Meal
 
 
 class MealModelTestCase(TestCase):
-    def setUp(self) -> None:
+    bread: Edible
+    butter: Edible
+    apple: Edible
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         # Create some edibles for testing
-        self.bread = Edible.objects.create(name="Bread")
-        self.butter = Edible.objects.create(name="Butter")
-        self.apple = Edible.objects.create(name="Apple")
+        cls.bread, cls.butter, cls.apple = Edible.objects.bulk_create(
+            [Edible(name="Bread"), Edible(name="Butter"), Edible(name="Apple")]
+        )
 
     def test_meal_creation(self) -> None:
         """Test that a meal can be created with all required fields."""
@@ -36,24 +42,16 @@ class MealModelTestCase(TestCase):
         valid_categories = ["BREAKFAST", "LUNCH", "DINNER", "SNACK"]
         eaten_at = timezone.now()
 
-        for category in valid_categories:
-            meal = Meal.objects.create(
-                title=f"Test {category}",
-                category=category,
-                eaten_at=eaten_at,
-            )
-            self.assertEqual(meal.category, category)
+        Meal.objects.bulk_create(
+            [
+                Meal(title=f"Test {category}", category=category, eaten_at=eaten_at)
+                for category in valid_categories
+            ]
+        )
 
-    def test_meal_str_representation(self) -> None:
-        """Test the string representation of a meal."""
-        eaten_at = timezone.make_aware(datetime(2025, 9, 30, 12, 0))
-        meal = Meal.objects.create(
-            title="Lunch Salad",
-            category="LUNCH",
-            eaten_at=eaten_at,
+        self.assertCountEqual(
+            Meal.objects.values_list("category", flat=True), valid_categories
         )
-        expected = "Lunch Salad (LUNCH) - 30.09.2025 12:00"
-        self.assertEqual(str(meal), expected)
 
     def test_meal_edibles_relationship(self) -> None:
         """Test the many-to-many relationship with edibles."""
@@ -65,8 +63,28 @@ class MealModelTestCase(TestCase):
         )
         meal.edibles.set([self.apple])
 
-        self.assertEqual(meal.edibles.count(), 1)
-        self.assertEqual(meal.edibles.first(), self.apple)
+        with self.assertNumQueries(1):
+            edibles = list(meal.edibles.all())
+        self.assertEqual(edibles, [self.apple])
+
+    def test_with_related_chains_after_filter(self) -> None:
+        """Test that with_related() can be chained onto a filtered queryset."""
+        eaten_at = timezone.now()
+        breakfast, lunch = Meal.objects.bulk_create(
+            [
+                Meal(title="Toast", category="BREAKFAST", eaten_at=eaten_at),
+                Meal(title="Apple", category="LUNCH", eaten_at=eaten_at),
+            ]
+        )
+        breakfast.edibles.set([self.bread, self.butter])
+        lunch.edibles.set([self.apple])
+
+        # meals, prefetched edibles
+        with self.assertNumQueries(2):
+            meals = list(Meal.objects.filter(category="BREAKFAST").with_related())
+            edibles = list(meals[0].edibles.all())
+        self.assertEqual(meals, [breakfast])
+        self.assertCountEqual(edibles, [self.bread, self.butter])
 
     def test_meal_creation_updates_timestamps(self) -> None:
         """Test that creation_date is set automatically."""
@@ -90,18 +108,34 @@ class MealModelTestCase(TestCase):
         )
         original_update_date = meal.update_date
 
-        # Simulate a small time delay
-        meal.title = "Updated Title"
-        meal.save()
+        # Simulate a later save without waiting for the clock
+        later = original_update_date + timedelta(seconds=1)
+        with patch("django.utils.timezone.now", return_value=later):
+            meal.title = "Updated Title"
+            meal.save()
         meal.refresh_from_db()
 
-        self.assertGreaterEqual(meal.update_date, original_update_date)
+        self.assertGreater(meal.update_date, original_update_date)
+
+
+class MealStrTestCase(SimpleTestCase):
+    def test_meal_str_representation(self) -> None:
+        """Test the string representation of a meal."""
+        eaten_at = timezone.make_aware(datetime(2025, 9, 30, 12, 0))
+        meal = Meal(title="Lunch Salad", category="LUNCH", eaten_at=eaten_at)
+        expected = "Lunch Salad (LUNCH) - 30.09.2025 12:00"
+        self.assertEqual(str(meal), expected)
 
 
 class MealFormTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bread = Edible.objects.create(name="Bread")
-        self.jam = Edible.objects.create(name="Jam")
+    bread: Edible
+    jam: Edible
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.bread, cls.jam = Edible.objects.bulk_create(
+            [Edible(name="Bread"), Edible(name="Jam")]
+        )
 
     def test_form_has_all_fields(self) -> None:
         """Test that the form includes all required fields."""
@@ -123,37 +157,19 @@ class MealFormTestCase(TestCase):
         form = MealForm(data=form_data)
         self.assertTrue(form.is_valid())
 
-    def test_form_missing_title(self) -> None:
-        """Test form validation fails when title is missing."""
-        eaten_at = timezone.now()
-        form_data = {
-            "category": "LUNCH",
-            "eaten_at": eaten_at,
-        }
-        form = MealForm(data=form_data)
-        self.assertFalse(form.is_valid())
-        self.assertIn("title", form.errors)
-
-    def test_form_missing_category(self) -> None:
-        """Test form validation fails when category is missing."""
-        eaten_at = timezone.now()
-        form_data = {
+    def test_form_missing_required_fields(self) -> None:
+        """Test form validation fails when a required field is missing."""
+        complete_data = {
             "title": "Test Meal",
-            "eaten_at": eaten_at,
-        }
-        form = MealForm(data=form_data)
-        self.assertFalse(form.is_valid())
-        self.assertIn("category", form.errors)
-
-    def test_form_missing_eaten_at(self) -> None:
-        """Test form validation fails when eaten_at is missing."""
-        form_data = {
-            "title": "Test Meal",
-            "category": "DINNER",
+            "category": "LUNCH",
+            "eaten_at": timezone.now(),
         }
-        form = MealForm(data=form_data)
-        self.assertFalse(form.is_valid())
-        self.assertIn("eaten_at", form.errors)
+        for field in complete_data:
+            with self.subTest(field=field):
+                form_data = {k: v for k, v in complete_data.items() if k != field}
+                form = MealForm(data=form_data)
+                self.assertFalse(form.is_valid())
+                self.assertIn(field, form.errors)
 
     def test_form_edibles_optional(self) -> None:
         """Test that edibles field is optional."""
@@ -193,6 +209,22 @@ class MealFormTestCase(TestCase):
             "form-select", form.fields["category"].widget.attrs.get("class", "")
         )
 
+    def test_form_widgets_have_tooltips(self) -> None:
+        """Test that each widget shows its help text as a Bootstrap tooltip."""
+        form = MealForm()
+        for name, field in form.fields.items():
+            with self.subTest(field=name):
+                self.assertEqual(field.widget.attrs["title"], field.help_text)
+                self.assertEqual(field.widget.attrs["data-bs-toggle"], "tooltip")
+
+    def test_form_renders_edibles_in_one_query(self) -> None:
+        """Test that rendering the edible choices does not query per edible."""
+        form = MealForm()
+        with self.assertNumQueries(1):
+            html = str(form["edibles"])
+        self.assertIn("Bread", html)
+        self.assertIn("Jam", html)
+
     def test_form_datetime_widget(self) -> None:
         """Test that eaten_at field has a datetime input widget."""
         form = MealForm()
@@ -201,14 +233,22 @@ class MealFormTestCase(TestCase):
 
 
 class MealViewTestCase(TestCase):
-    def setUp(self) -> None:
-        self.bread = Edible.objects.create(name="Bread")
-        self.cheese = Edible.objects.create(name="Cheese")
-        # Create and login a test user
-        self.user = User.objects.create_user(
+    bread: Edible
+    cheese: Edible
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.bread, cls.cheese = Edible.objects.bulk_create(
+            [Edible(name="Bread"), Edible(name="Cheese")]
+        )
+        # Create a test user
+        cls.user = User.objects.create_user(
             username="testuser", password="testpassword123"
         )
-        self.client.login(username="testuser", password="testpassword123")
+
+    def setUp(self) -> None:
+        self.client.force_login(self.user)
 
     def test_index_view_get(self) -> None:
         """Test GET request to meals index view."""
@@ -230,10 +270,9 @@ class MealViewTestCase(TestCase):
         response = self.client.post("/meals/", post_data)
 
         self.assertEqual(response.status_code, 302)  # Redirect after success
-        self.assertEqual(Meal.objects.count(), 1)
-        meal = Meal.objects.first()
-        self.assertIsNotNone(meal)
-        assert meal is not None  # Type narrowing for mypy
+        meals = list(Meal.objects.all())
+        self.assertEqual(len(meals), 1)
+        meal = meals[0]
         self.assertEqual(meal.title, "Test Meal")
         self.assertEqual(meal.category, "BREAKFAST")
         self.assertEqual(meal.edibles.count(), 2)
@@ -256,10 +295,12 @@ class MealViewTestCase(TestCase):
         earlier = timezone.make_aware(datetime(2025, 9, 29, 10, 0))
         later = timezone.make_aware(datetime(2025, 9, 30, 12, 0))
 
-        Meal.objects.create(
-            title="Earlier Meal", category="BREAKFAST", eaten_at=earlier
+        Meal.objects.bulk_create(
+            [
+                Meal(title="Earlier Meal", category="BREAKFAST", eaten_at=earlier),
+                Meal(title="Later Meal", category="LUNCH", eaten_at=later),
+            ]
         )
-        Meal.objects.create(title="Later Meal", category="LUNCH", eaten_at=later)
 
         response = self.client.get("/meals/")
         meals = response.context["meals"]
@@ -271,12 +312,12 @@ class MealViewTestCase(TestCase):
         """Test that index view limits number of meals displayed."""
         eaten_at = timezone.now()
         # Create more than 10 meals
-        for i in range(15):
-            Meal.objects.create(
-                title=f"Meal {i}",
-                category="SNACK",
-                eaten_at=eaten_at,
-            )
+        Meal.objects.bulk_create(
+            [
+                Meal(title=f"Meal {i}", category="SNACK", eaten_at=eaten_at)
+                for i in range(15)
+            ]
+        )
 
         response = self.client.get("/meals/")
         meals = response.context["meals"]
@@ -284,6 +325,31 @@ class MealViewTestCase(TestCase):
         # Should only show latest 10
         self.assertEqual(len(meals), 10)
 
+    def test_index_view_query_count(self) -> None:
+        """Test that rendering the index does not query once per meal."""
+        eaten_at = timezone.now()
+        meals = Meal.objects.bulk_create(
+            [
+                Meal(title=f"Meal {i}", category="SNACK", eaten_at=eaten_at)
+                for i in range(20)
+            ]
+        )
+        Meal.edibles.through.objects.bulk_create(
+            [
+                Meal.edibles.through(meal=meal, edible=edible)
+                for meal in meals
+                for edible in (self.bread, self.cheese)
+            ]
+        )
+
+        # session, user, latest meals, edible choices
+        with self.assertNumQueries(4):
+            response = self.client.get("/meals/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, '<span class="badge bg-secondary">2</span>', count=10
+        )
+
     def test_detail_view_get(self) -> None:
         """Test GET request to meal detail view."""
         eaten_at = timezone.now()
@@ -314,6 +380,21 @@ class MealViewTestCase(TestCase):
         self.assertContains(response, "Bread")
         self.assertContains(response, "Cheese")
 
+    def test_detail_view_query_count(self) -> None:
+        """Test that the detail view loads all edibles of a meal in one query."""
+        meal = Meal.objects.create(
+            title="Breakfast Toast",
+            category="BREAKFAST",
+            eaten_at=timezone.now(),
+        )
+        meal.edibles.set([self.bread, self.cheese])
+
+        # session, user, meal, edibles
+        with self.assertNumQueries(4):
+            response = self.client.get(f"/meals/{meal.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Cheese")
+
     def test_detail_view_404_for_nonexistent_meal(self) -> None:
         """Test that detail view returns 404 for nonexistent meal."""
         response = self.client.get("/meals/99999/")
@@ -1,5 +1,5 @@
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_http_methods
@@ -14,14 +14,14 @@ def index(request: HttpRequest) -> HttpResponse:
     if request.method == "POST":
         form = MealForm(request.POST)
         if form.is_valid():
-            form.save()
+            # Commit the row and its many-to-many links together
+            with transaction.atomic():
+                form.save()
             return redirect("meals:index")
     else:
         form = MealForm()
 
-    latest_meals = Meal.objects.annotate(num_edibles=Count("edibles")).order_by(
-        "-eaten_at"
-    )[:10]
+    latest_meals = Meal.objects.recent_with_edible_counts()
 
     return render(
         request,
@@ -33,7 +33,7 @@ def index(request: HttpRequest) -> HttpResponse:
 @login_required
 @require_http_methods(["GET"])
 def detail(request: HttpRequest, meal_id: int) -> HttpResponse:
-    meal = get_object_or_404(Meal.objects.prefetch_related("edibles"), pk=meal_id)
+    meal = get_object_or_404(Meal.objects.with_related(), pk=meal_id)
     return render(
         request,
         "meals/detail.html",
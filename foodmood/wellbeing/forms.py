@@ -66,14 +66,22 @@ OptionFormSet = inlineformset_factory(
 )
 
 
-class EntryForm(forms.ModelForm):
+class BaseEntryForm(forms.ModelForm):
+    """Base for the entry forms, whose category choice labels only need the name."""
+
+    category = forms.ModelChoiceField(
+        queryset=WellbeingCategory.objects.only("id", "name"),
+        widget=forms.Select(attrs={"class": "form-select"}),
+    )
+
+
+class EntryForm(BaseEntryForm):
     """Full entry form with all fields."""
 
     class Meta:
         model = WellbeingEntry
         fields = ["category", "option", "recorded_at", "notes"]
         widgets = {
-            "category": forms.Select(attrs={"class": "form-select"}),
             "option": forms.Select(attrs={"class": "form-select"}),
             "recorded_at": forms.DateTimeInput(
                 attrs={"class": "form-control", "type": "datetime-local"},
@@ -84,31 +92,30 @@ class EntryForm(forms.ModelForm):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
+        option_field = self.fields["option"]
+        assert isinstance(option_field, ModelChoiceField)
+        # Option labels include the category name, so join it in
+        option_field.queryset = WellbeingOption.objects.select_related("category")
         # If category is pre-selected, filter options
         if "category" in self.data:
             try:
                 category_id = int(self.data.get("category"))  # type: ignore[arg-type]
-                option_field = self.fields["option"]
-                assert isinstance(option_field, ModelChoiceField)
-                option_field.queryset = WellbeingOption.objects.filter(
+                option_field.queryset = option_field.queryset.filter(
                     category_id=category_id
                 ).order_by("order", "value")
             except (ValueError, TypeError):
                 pass
         elif self.instance.pk and self.instance.category:
-            option_field = self.fields["option"]
-            assert isinstance(option_field, ModelChoiceField)
             option_field.queryset = self.instance.category.options.all()
 
 
-class QuickEntryForm(forms.ModelForm):
+class QuickEntryForm(BaseEntryForm):
     """Quick entry form for fast logging."""
 
     class Meta:
         model = WellbeingEntry
         fields = ["category", "option"]
         widgets = {
-            "category": forms.Select(attrs={"class": "form-select"}),
             "option": forms.RadioSelect(attrs={"class": "form-check-input"}),
         }
 
@@ -1 +1,57 @@
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from .models import WellbeingCategory, WellbeingEntry, WellbeingOption
+
+
+class WellbeingViewTestCase(TestCase):
+    user: User
+    categories: list[WellbeingCategory]
+    options: list[WellbeingOption]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.categories = WellbeingCategory.objects.bulk_create(
+            [WellbeingCategory(name=name) for name in ("Energy", "Mood", "Sleep")]
+        )
+        cls.options = WellbeingOption.objects.bulk_create(
+            [
+                WellbeingOption(category=category, label=label, value=value)
+                for category in cls.categories
+                for value, label in ((1, "Low"), (2, "High"))
+            ]
+        )
+
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpassword123"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_login(self.user)
+
+    def test_entry_bulk_creates_an_entry_per_answered_category(self) -> None:
+        """Test that the daily check-in creates entries in a single INSERT."""
+        # Answer Energy and Mood, skip Sleep
+        answers = [option for option in self.options if option.value == 2][:2]
+        post_data = {"recorded_at": "2025-09-30T08:00", "notes": "Daily check-in"}
+        post_data.update(
+            {f"category_{option.category.pk}": str(option.pk) for option in answers}
+        )
+
+        # session, user, categories, options, one lookup per answer, insert
+        with self.assertNumQueries(7):
+            response = self.client.post("/wellbeing/entries/bulk/", post_data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertCountEqual(
+            WellbeingEntry.objects.values_list("category_id", "option_id", "notes"),
+            [(option.category.pk, option.pk, "Daily check-in") for option in answers],
+        )
+
+    def test_entry_create_view_query_count(self) -> None:
+        """Test that rendering the option labels does not query per option."""
+        # session, user, categories, options joined with their category
+        with self.assertNumQueries(4):
+            response = self.client.get("/wellbeing/entries/create/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Energy: High")
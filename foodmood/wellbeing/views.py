@@ -244,21 +244,22 @@ def entry_bulk(request: HttpRequest) -> HttpResponse:
             recorded_at = form.cleaned_data["recorded_at"]
             notes = form.cleaned_data.get("notes", "")
 
-            entries_created = 0
-            with transaction.atomic():
-                for field_name, option in form.cleaned_data.items():
-                    if field_name.startswith("category_") and option:
-                        category_id = int(field_name.split("_")[1])
-                        category = WellbeingCategory.objects.get(pk=category_id)
-                        WellbeingEntry.objects.create(
-                            category=category,
+            entries = []
+            for field_name, option in form.cleaned_data.items():
+                if field_name.startswith("category_") and option:
+                    # The field's queryset only holds options of its category
+                    entries.append(
+                        WellbeingEntry(
+                            category_id=option.category_id,
                             option=option,
                             recorded_at=recorded_at,
                             notes=notes,
                         )
-                        entries_created += 1
+                    )
+            # Insert all entries in a single query
+            WellbeingEntry.objects.bulk_create(entries)
 
-            messages.success(request, f"Created {entries_created} wellbeing entries")
+            messages.success(request, f"Created {len(entries)} wellbeing entries")
             return redirect("wellbeing:dashboard")
     else:
         form = BulkEntryForm()